@@ -5,12 +5,300 @@ This script demonstrates how to interact with the remote MCP server from Python
 """
 
 import os
+import abc
+import copy
 import json
+import time
+import random
+import itertools
+import ssl
+import socket
+import asyncio
+import threading
+import email.utils
 import requests
-from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple, Iterator, AsyncIterator, Callable
+from datetime import timezone
+from urllib.parse import urlsplit
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 
-class SlackMCPClient:
-    """Client for interacting with the Slack MCP Server"""
+try:
+    import httpx
+except ImportError:  # Only needed for AsyncSlackMCPClient
+    httpx = None
+
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # Fall back to the stdlib json module
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+    _json_loads = json.loads
+
+# Tools without side effects; identical in-flight calls to these share one request
+READ_ONLY_TOOLS = frozenset({
+    "slack_list_channels",
+    "slack_get_channel_history",
+    "slack_get_thread_replies",
+    "slack_get_users",
+    "slack_get_user_profile"
+})
+
+# Pre-serialized bodies for the fixed-shape methods; only the id is filled in per call
+_INITIALIZE_TEMPLATE = (
+    b'{"jsonrpc":"2.0","method":"initialize","params":{"protocolVersion":"2024-11-05",'
+    b'"capabilities":{},"clientInfo":{"name":"python-client","version":"1.0.0"}},"id":%d}'
+)
+_LIST_TOOLS_TEMPLATE = b'{"jsonrpc":"2.0","method":"tools/list","params":{},"id":%d}'
+
+# Default cap on calls per JSON-RPC batch; bigger batches are split. initialize()
+# lowers it to the server's advertised maxBatchSize if that is smaller.
+MAX_BATCH_SIZE = 50
+
+# How long a fetched user profile is served from cache, in seconds
+PROFILE_CACHE_TTL = 300.0
+
+# Retry policy for transient failures: exponential backoff with jitter, capped
+RETRY_TOTAL = 5
+RETRY_BACKOFF_FACTOR = 0.2
+RETRY_BACKOFF_JITTER = 0.1
+RETRY_BACKOFF_MAX = 10.0
+# Longest Retry-After worth waiting for; past it the 429/503 goes back to the caller
+RETRY_AFTER_MAX = 60.0
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Statuses meaning the request was refused before being processed, so even a
+# POST with side effects (e.g. slack_post_message) can be repeated safely
+RETRY_REFUSED_STATUSES = (429, 503)
+
+# Server hostnames resolved once at client creation, mapped to the address to dial
+_PINNED_ADDRESSES: Dict[str, str] = {}
+
+def _pin_host(server_url: str) -> None:
+    """Resolve the server host once so new pool connections skip the DNS lookup"""
+    parts = urlsplit(server_url)
+    if not parts.hostname or parts.hostname in _PINNED_ADDRESSES:
+        return
+    try:
+        infos = socket.getaddrinfo(parts.hostname, parts.port, type=socket.SOCK_STREAM)
+    except OSError:
+        return  # Leave resolution to the connection, which reports the error
+    # Prefer IPv4 like urllib3 does, e.g. "localhost" may list ::1 first
+    infos.sort(key=lambda info: info[0] != socket.AF_INET)
+    _PINNED_ADDRESSES[parts.hostname] = infos[0][4][0]
+
+
+class _PinnedHTTPConnection(HTTPConnection):
+    """HTTPConnection that dials the pinned address of its host, if any"""
+    
+    def _new_conn(self) -> socket.socket:
+        host = self._dns_host
+        address = _PINNED_ADDRESSES.get(host)
+        if address is None:
+            return super()._new_conn()
+        
+        # Only the TCP connect uses the address; Host header and TLS SNI keep the name
+        self._dns_host = address
+        try:
+            return super()._new_conn()
+        except Exception:
+            # The address may be stale; resolve normally on the next attempt
+            _PINNED_ADDRESSES.pop(host, None)
+            raise
+        finally:
+            self._dns_host = host
+
+
+class _PinnedHTTPSConnection(_PinnedHTTPConnection, HTTPSConnection):
+    
+    def close(self) -> None:
+        # TLS 1.3 tickets arrive after the handshake, so save the session again on close
+        context = getattr(self.sock, "context", None)
+        if isinstance(context, _ResumingSSLContext):
+            context.remember_session(self.sock)
+        super().close()
+
+
+def _session_key(sock: socket.socket, host: Optional[str]) -> Optional[Tuple[str, int]]:
+    if not host:
+        return None
+    try:
+        return host, sock.getpeername()[1]
+    except (OSError, IndexError):
+        return None
+
+
+class _ResumingSSLContext(ssl.SSLContext):
+    """
+    SSLContext that resumes the previous TLS session with a host, so a
+    reconnect after the keep-alive connection expires skips the full handshake
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        # Most recent session per (host, port); a session only resumes on the context that made it
+        self._sessions: Dict[Tuple[str, int], ssl.SSLSession] = {}
+    
+    def wrap_socket(self, sock, *args, server_hostname=None, **kwargs):
+        key = _session_key(sock, server_hostname)
+        if kwargs.get("session") is None and key in self._sessions:
+            kwargs["session"] = self._sessions[key]
+        if kwargs.get("session") is None:
+            ssl_sock = super().wrap_socket(sock, *args, server_hostname=server_hostname, **kwargs)
+        else:
+            # A rejected session closes the socket it was offered on, so keep a handle to retry with
+            spare = sock.dup()
+            try:
+                ssl_sock = super().wrap_socket(sock, *args, server_hostname=server_hostname, **kwargs)
+            except ValueError:
+                # Session from another SSLContext; forget it and do a full handshake
+                self._sessions.pop(key, None)
+                kwargs["session"] = None
+                ssl_sock = super().wrap_socket(spare, *args, server_hostname=server_hostname, **kwargs)
+            except BaseException:
+                spare.close()
+                raise
+            else:
+                spare.close()
+        self.remember_session(ssl_sock)
+        return ssl_sock
+    
+    def remember_session(self, ssl_sock: ssl.SSLSocket) -> None:
+        key = _session_key(ssl_sock, ssl_sock.server_hostname)
+        session = ssl_sock.session
+        if key is not None and session is not None:
+            self._sessions[key] = session
+
+
+def _create_ssl_context() -> ssl.SSLContext:
+    context = _ResumingSSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.minimum_version = ssl.TLSVersion.TLSv1_2
+    # Session tickets are what make resumption possible
+    context.options &= ~ssl.OP_NO_TICKET
+    return context
+
+
+class _RetryPolicy(Retry):
+    """urllib3 Retry that also repeats POSTs, but only when the server refused them"""
+    
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method == "POST":
+            return status_code in RETRY_REFUSED_STATUSES
+        return super().is_retry(method, status_code, has_retry_after)
+    
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        # Retrying before Retry-After only earns another refusal, so hand the response back instead
+        retry_after = _parse_retry_after(response.headers.get("Retry-After")) if response else None
+        if retry_after is not None and retry_after > RETRY_AFTER_MAX:
+            raise MaxRetryError(_pool, url, ResponseError(f"Retry-After of {retry_after:.0f}s exceeds RETRY_AFTER_MAX"))
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+    
+    def get_retry_after(self, response) -> Optional[float]:
+        # Same parsing as AsyncSlackMCPClient; an unparseable header falls back to backoff
+        return _parse_retry_after(response.headers.get("Retry-After"))
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds from a Retry-After header (delay-seconds or HTTP-date), or None if absent/invalid"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(when.timestamp() - time.time(), 0.0)
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> Optional[float]:
+    """
+    Seconds to wait before retry number attempt (0-based): the full Retry-After
+    if given, else capped exponential backoff with jitter. None means do not retry.
+    """
+    seconds = _parse_retry_after(retry_after)
+    if seconds is not None:
+        return seconds if seconds <= RETRY_AFTER_MAX else None
+    delay = RETRY_BACKOFF_FACTOR * 2 ** attempt + random.random() * RETRY_BACKOFF_JITTER
+    return min(delay, RETRY_BACKOFF_MAX)
+
+
+class _PinnedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _PinnedHTTPConnection
+
+
+class _PinnedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _PinnedHTTPSConnection
+
+
+class _PinnedDNSAdapter(HTTPAdapter):
+    """HTTPAdapter whose pools connect to pre-resolved server addresses and resume TLS sessions"""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("ssl_context", _create_ssl_context())
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _PinnedHTTPConnectionPool,
+            "https": _PinnedHTTPSConnectionPool
+        }
+
+
+class _UnixHTTPConnection(HTTPConnection):
+    """HTTPConnection over a UNIX domain socket instead of TCP"""
+    
+    def __init__(self, *args, socket_path: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.socket_path = socket_path
+    
+    def _new_conn(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if isinstance(self.timeout, (int, float)):
+            sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+
+class _UnixHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _UnixHTTPConnection
+
+
+class _UnixSocketAdapter(HTTPAdapter):
+    """HTTPAdapter that sends every request through one UNIX socket connection pool"""
+    
+    def __init__(self, socket_path: str, **kwargs):
+        super().__init__(**kwargs)
+        self._unix_pool = _UnixHTTPConnectionPool(
+            "localhost",
+            maxsize=kwargs.get("pool_maxsize", 10),
+            socket_path=socket_path
+        )
+    
+    def get_connection_with_tls_context(self, request, verify, proxies=None, cert=None):
+        return self._unix_pool
+    
+    def get_connection(self, url, proxies=None):
+        return self._unix_pool
+    
+    def close(self) -> None:
+        super().close()
+        self._unix_pool.close()
+
+
+class _BaseSlackMCPClient(abc.ABC):
+    """Transport-independent state and JSON-RPC payload builders"""
     
     def __init__(
         self,
@@ -18,112 +306,174 @@ class SlackMCPClient:
         slack_bot_token: Optional[str] = None,
         slack_team_id: Optional[str] = None,
         secret_key: Optional[str] = None,
-        slack_channel_ids: Optional[str] = None
+        slack_channel_ids: Optional[str] = None,
+        unix_socket: Optional[str] = None,
+        max_response_bytes: Optional[int] = None,
+        max_batch_size: int = MAX_BATCH_SIZE
     ):
+        # A local server can be reached over a UNIX domain socket, either with
+        # server_url="unix:///path/to.sock" or unix_socket="/path/to.sock"
+        if server_url.startswith("unix://"):
+            unix_socket = server_url[len("unix://"):]
+        self.unix_socket = unix_socket
+        if self.unix_socket:
+            # The host is only used for the Host header; requests go to the socket
+            server_url = "http://localhost"
         self.server_url = server_url
+        self._mcp_url = f"{server_url}/mcp"
         self.slack_bot_token = slack_bot_token or os.getenv("SLACK_BOT_TOKEN")
         self.slack_team_id = slack_team_id or os.getenv("SLACK_TEAM_ID")
         self.secret_key = secret_key or os.getenv("SECRET_KEY")
         self.slack_channel_ids = slack_channel_ids or os.getenv("SLACK_CHANNEL_IDS")
-        self.request_id = 0
-    
-    def _get_next_id(self) -> int:
-        """Get next request ID"""
-        self.request_id += 1
-        return self.request_id
-    
-    def _get_headers(self, include_slack_creds: bool = False) -> Dict[str, str]:
-        """Get headers for the request"""
-        headers = {
-            "Content-Type": "application/json"
-        }
+        # Request IDs from a C-level counter: no Python arithmetic, atomic under the GIL
+        self._next_id = itertools.count(1).__next__
+        # Responses larger than this are rejected before any JSON decoding
+        self.max_response_bytes = max_response_bytes
+        # Set from the server's capabilities by initialize()
+        self.supports_batching = False
+        self.max_batch_size = max_batch_size
         
-        if include_slack_creds:
-            if self.slack_bot_token:
-                headers["x-slack-bot-token"] = self.slack_bot_token
-            if self.slack_team_id:
-                headers["x-slack-team-id"] = self.slack_team_id
-            if self.slack_channel_ids:
-                headers["x-slack-channel-ids"] = self.slack_channel_ids
-            if self.secret_key:
-                headers["x-secret-key"] = self.secret_key
+        # Result caches for idempotent calls
+        self._tools_cache: Optional[Dict[str, Any]] = None
+        self._profile_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
         
-        return headers
+        # Headers are computed once; the transport sends _base_headers by default
+        # and tools/call requests add the Slack credential headers on top
+        self._base_headers = {
+            "Content-Type": "application/json",
+            # Only advertises encodings we can decode (br needs the brotli package)
+            "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"]
+        }
+        self._slack_headers = {
+            name: value
+            for name, value in [
+                ("x-slack-bot-token", self.slack_bot_token),
+                ("x-slack-team-id", self.slack_team_id),
+                ("x-slack-channel-ids", self.slack_channel_ids),
+                ("x-secret-key", self.secret_key)
+            ]
+            if value
+        }
     
-    def health_check(self) -> Dict[str, Any]:
-        """Check server health"""
-        response = requests.get(f"{self.server_url}/health")
-        response.raise_for_status()
-        return response.json()
+    def _initialize_payload(self) -> bytes:
+        return _INITIALIZE_TEMPLATE % self._next_id()
     
-    def get_server_info(self) -> Dict[str, Any]:
-        """Get server information"""
-        response = requests.get(f"{self.server_url}/")
-        response.raise_for_status()
-        return response.json()
+    def _list_tools_payload(self) -> bytes:
+        return _LIST_TOOLS_TEMPLATE % self._next_id()
     
-    def initialize(self) -> Dict[str, Any]:
-        """Initialize MCP connection"""
-        payload = {
+    def _call_tool_payload(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        return {
             "jsonrpc": "2.0",
-            "method": "initialize",
+            "method": "tools/call",
             "params": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {},
-                "clientInfo": {
-                    "name": "python-client",
-                    "version": "1.0.0"
-                }
+                "name": tool_name,
+                "arguments": arguments
             },
-            "id": self._get_next_id()
+            "id": self._next_id()
         }
-        
-        response = requests.post(
-            f"{self.server_url}/mcp",
-            headers=self._get_headers(),
-            json=payload
-        )
-        response.raise_for_status()
-        return response.json()
     
-    def list_tools(self) -> Dict[str, Any]:
-        """List available tools"""
-        payload = {
-            "jsonrpc": "2.0",
-            "method": "tools/list",
-            "params": {},
-            "id": self._get_next_id()
+    def _record_capabilities(self, init_result: Dict[str, Any]) -> None:
+        """Remember optional server features advertised in the initialize response"""
+        capabilities = init_result.get("result", {}).get("capabilities") or {}
+        experimental = capabilities.get("experimental") or {}
+        self.supports_batching = "batching" in experimental
+        max_batch_size = (experimental.get("batching") or {}).get("maxBatchSize")
+        if isinstance(max_batch_size, int) and max_batch_size > 0:
+            self.max_batch_size = min(self.max_batch_size, max_batch_size)
+    
+    def _batch_payloads(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[List[Dict[str, Any]]]:
+        """Split calls into tools/call batch payloads of at most max_batch_size requests"""
+        return [
+            [
+                self._call_tool_payload(tool_name, arguments)
+                for tool_name, arguments in calls[start:start + self.max_batch_size]
+            ]
+            for start in range(0, len(calls), self.max_batch_size)
+        ]
+    
+    @staticmethod
+    def _match_batch_responses(payload: List[Dict[str, Any]], responses: Any) -> List[Dict[str, Any]]:
+        """
+        Order batch responses like the requests (the server may reorder them).
+        An error for the batch as a whole (e.g. batch too large) is reported for every request.
+        """
+        if not isinstance(responses, list):
+            responses = [responses]
+        by_id = {response.get("id"): response for response in responses}
+        batch_error = by_id.get(None, {}).get("error") or {
+            "code": -32603,
+            "message": "No response for request in batch"
         }
-        
-        response = requests.post(
-            f"{self.server_url}/mcp",
-            headers=self._get_headers(),
-            json=payload
-        )
-        response.raise_for_status()
-        return response.json()
+        return [
+            by_id.get(request["id"]) or {"jsonrpc": "2.0", "error": batch_error, "id": request["id"]}
+            for request in payload
+        ]
+    
+    def _check_response_size(self, size: Any) -> None:
+        """Reject a response body over max_response_bytes before it is decoded"""
+        if self.max_response_bytes is not None and size is not None and int(size) > self.max_response_bytes:
+            raise ValueError(
+                f"Response of {size} bytes exceeds max_response_bytes={self.max_response_bytes}"
+            )
+    
+    @staticmethod
+    def decode_tool_result(response: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Decode the Slack payload embedded in a tools/call response.
+        JSON-RPC errors raise RuntimeError without parsing any tool output.
+        """
+        if "error" in response:
+            raise RuntimeError(response["error"].get("message", "Unknown error"))
+        return _json_loads(response["result"]["content"][0]["text"])
+    
+    @classmethod
+    def _tool_result_ok(cls, response: Dict[str, Any]) -> bool:
+        """Whether a tools/call response carries a successful Slack result"""
+        try:
+            return bool(cls.decode_tool_result(response).get("ok"))
+        except (KeyError, IndexError, TypeError, ValueError, RuntimeError):
+            return False
+    
+    @classmethod
+    def _parse_page(cls, response: Dict[str, Any], tool_name: str) -> Dict[str, Any]:
+        """Decode a paginated tool result, raising if the call failed"""
+        try:
+            page = cls.decode_tool_result(response)
+        except RuntimeError as e:
+            raise RuntimeError(f"{tool_name} failed: {e}") from None
+        if not page.get("ok"):
+            raise RuntimeError(f"{tool_name} failed: {page.get('error', 'Unknown error')}")
+        return page
     
+    @staticmethod
+    def _dedupe_key(tool_name: str, arguments: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+        """Key shared by identical tool calls, or None if the arguments are not JSON-serializable"""
+        try:
+            return tool_name, json.dumps(arguments, sort_keys=True, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return None
+    
+    def _get_cached_profile(self, user_id: str) -> Optional[Dict[str, Any]]:
+        cached = self._profile_cache.get(user_id)
+        if cached and time.monotonic() - cached[0] < PROFILE_CACHE_TTL:
+            # A copy, so callers cannot alter what later hits see
+            return copy.deepcopy(cached[1])
+        return None
+    
+    def _cache_profile(self, user_id: str, response: Dict[str, Any]) -> None:
+        if self._tool_result_ok(response):
+            self._profile_cache[user_id] = (time.monotonic(), copy.deepcopy(response))
+    
+    @abc.abstractmethod
     def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """Call a tool"""
-        payload = {
-            "jsonrpc": "2.0",
-            "method": "tools/call",
-            "params": {
-                "name": tool_name,
-                "arguments": arguments
-            },
-            "id": self._get_next_id()
-        }
-        
-        response = requests.post(
-            f"{self.server_url}/mcp",
-            headers=self._get_headers(include_slack_creds=True),
-            json=payload
-        )
-        response.raise_for_status()
-        return response.json()
+        """Call a tool; the convenience methods below are built on this"""
     
-    # Convenience methods for Slack operations
+    @abc.abstractmethod
+    def batch(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Call several tools in JSON-RPC batch requests; results keep the order of calls"""
+    
+    # Convenience methods for Slack operations.
+    # On AsyncSlackMCPClient these return awaitables, since call_tool is async there.
     
     def list_channels(self, limit: int = 100, cursor: Optional[str] = None) -> Dict[str, Any]:
         """List Slack channels"""
@@ -181,19 +531,562 @@ class SlackMCPClient:
         return self.call_tool("slack_get_user_profile", {
             "user_id": user_id
         })
+    
+    def get_users_bulk(self, user_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get several user profiles in one batch request"""
+        return self.batch([
+            ("slack_get_user_profile", {"user_id": user_id})
+            for user_id in user_ids
+        ])
 
 
-def main():
-    """Example usage"""
-    print("Slack MCP Client Example\n")
+class SlackMCPClient(_BaseSlackMCPClient):
+    """Client for interacting with the Slack MCP Server"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        
+        # One pooled keep-alive session so repeated calls skip the TCP/TLS handshake
+        self._session = requests.Session()
+        adapter_kwargs = dict(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=_RetryPolicy(
+                total=RETRY_TOTAL,
+                backoff_factor=RETRY_BACKOFF_FACTOR,
+                backoff_jitter=RETRY_BACKOFF_JITTER,
+                backoff_max=RETRY_BACKOFF_MAX,
+                status_forcelist=RETRY_STATUSES,
+                respect_retry_after_header=True,
+                # Hand the last response back so _post_raw/_get raise HTTPError as usual
+                raise_on_status=False
+            )
+        )
+        if self.unix_socket:
+            self._session.mount("http://", _UnixSocketAdapter(self.unix_socket, **adapter_kwargs))
+        else:
+            _pin_host(self.server_url)
+            adapter = _PinnedDNSAdapter(**adapter_kwargs)
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+        self._session.headers.update(self._base_headers)
+        self._session.headers["Connection"] = "keep-alive"
+        # Pre-bound for the per-request hot path
+        self._post_fn = self._session.post
+        
+        # Pending read-only tool calls, keyed by (tool_name, arguments)
+        self._inflight: Dict[Tuple[str, str], Future] = {}
+        self._inflight_lock = threading.Lock()
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session"""
+        self._session.close()
+    
+    def __enter__(self) -> "SlackMCPClient":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def _post_raw(self, payload: Any, slack: bool = False) -> bytes:
+        """POST a JSON-RPC payload, batch or pre-serialized body to /mcp and return the raw body"""
+        # Streamed so an oversized body can be refused from its Content-Length alone
+        with self._post_fn(
+            self._mcp_url,
+            headers=self._slack_headers if slack else None,
+            data=payload if isinstance(payload, bytes) else _json_dumps(payload),
+            stream=True
+        ) as response:
+            if response.status_code >= 400:
+                raise requests.HTTPError(
+                    f"{response.status_code} Error for url: {response.url}",
+                    response=response
+                )
+            self._check_response_size(response.headers.get("Content-Length"))
+            content = response.content
+        self._check_response_size(len(content))
+        return content
+    
+    def _post(self, payload: Any, slack: bool = False) -> Any:
+        """POST a JSON-RPC payload (or batch) to the MCP endpoint"""
+        return _json_loads(self._post_raw(payload, slack))
+    
+    def _get(self, path: str) -> Dict[str, Any]:
+        """GET a JSON document from the server"""
+        response = self._session.get(f"{self.server_url}{path}")
+        if response.status_code >= 400:
+            raise requests.HTTPError(
+                f"{response.status_code} Error for url: {response.url}",
+                response=response
+            )
+        return _json_loads(response.content)
+    
+    def health_check(self) -> Dict[str, Any]:
+        """Check server health"""
+        return self._get("/health")
+    
+    def is_healthy(self) -> bool:
+        """Cheap health probe that skips JSON decoding"""
+        response = self._session.get(f"{self.server_url}/health")
+        return response.status_code == 200 and b'"healthy"' in response.content
+    
+    def get_server_info(self) -> Dict[str, Any]:
+        """Get server information"""
+        return self._get("/")
+    
+    def initialize(self) -> Dict[str, Any]:
+        """Initialize MCP connection"""
+        result = self._post(self._initialize_payload())
+        self._record_capabilities(result)
+        return result
+    
+    def list_tools(self, refresh: bool = False) -> Dict[str, Any]:
+        """List available tools (cached after the first successful call)"""
+        if self._tools_cache is None or refresh:
+            result = self._post(self._list_tools_payload())
+            if "error" in result:
+                return result
+            self._tools_cache = result
+        # A copy, so callers cannot alter what later calls see
+        return copy.deepcopy(self._tools_cache)
+    
+    def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Call a tool"""
+        key = self._dedupe_key(tool_name, arguments) if tool_name in READ_ONLY_TOOLS else None
+        if key is None:
+            return self._post(self._call_tool_payload(tool_name, arguments), slack=True)
+        
+        # Threads issuing the same read-only call concurrently wait for one request
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = self._inflight[key] = Future()
+        if not is_owner:
+            # Each waiter gets its own copy of the shared response
+            return copy.deepcopy(future.result())
+        
+        try:
+            result = self._post(self._call_tool_payload(tool_name, arguments), slack=True)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
     
-    # Create client
-    client = SlackMCPClient()
+    def call_tool_raw(self, tool_name: str, arguments: Dict[str, Any]) -> bytes:
+        """Call a tool and return the undecoded JSON-RPC response body"""
+        return self._post_raw(self._call_tool_payload(tool_name, arguments), slack=True)
+    
+    def get_user_profile(self, user_id: str) -> Dict[str, Any]:
+        """Get user profile (cached for PROFILE_CACHE_TTL seconds)"""
+        cached = self._get_cached_profile(user_id)
+        if cached is not None:
+            return cached
+        result = super().get_user_profile(user_id)
+        self._cache_profile(user_id, result)
+        return result
+    
+    def iter_channels(self, page_size: int = 200) -> Iterator[Dict[str, Any]]:
+        """Yield every channel, following pagination cursors"""
+        cursor = None
+        while True:
+            page = self._parse_page(self.list_channels(limit=page_size, cursor=cursor), "slack_list_channels")
+            yield from page.get("channels", [])
+            cursor = page.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                break
+    
+    def iter_users(self, page_size: int = 200) -> Iterator[Dict[str, Any]]:
+        """Yield every workspace user, following pagination cursors"""
+        cursor = None
+        while True:
+            page = self._parse_page(self.get_users(limit=page_size, cursor=cursor), "slack_get_users")
+            yield from page.get("members", [])
+            cursor = page.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                break
+    
+    def batch(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Call several tools in JSON-RPC batch requests of up to max_batch_size calls.
+        Results are returned in the order of calls. Falls back to one request
+        per call if initialize() did not report batching support.
+        """
+        if not self.supports_batching:
+            return [self.call_tool(tool_name, arguments) for tool_name, arguments in calls]
+        
+        results = []
+        for payload in self._batch_payloads(calls):
+            results.extend(self._match_batch_responses(payload, self._post(payload, slack=True)))
+        return results
+    
+    def call_tool_many(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]],
+        chunk_size: Optional[int] = None,
+        max_workers: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Call many tools as fast as the server allows; results keep the order of calls.
+        Calls are sent as JSON-RPC batches of chunk_size (default max_batch_size, or
+        one per request if the server does not support batching), with up to max_workers requests in flight
+        over the shared connection pool. Network waits release the GIL, so threads
+        overlap them without a native extension.
+        """
+        if self.supports_batching:
+            chunk_size = chunk_size or self.max_batch_size
+            chunks = [calls[i:i + chunk_size] for i in range(0, len(calls), chunk_size)]
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return [result for chunk in executor.map(self.batch, chunks) for result in chunk]
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda call: self.call_tool(*call), calls))
+
+
+class BatchingSlackMCPClient:
+    """
+    Wraps a SlackMCPClient and coalesces tool calls made within buffer_ms of
+    each other (or up to buffer_max calls) into a single JSON-RPC batch request.
+    call_tool() returns a concurrent.futures.Future for each call.
+    
+    Call initialize() on the wrapped client first so it knows the server
+    supports batching; otherwise each flush falls back to one request per call.
+    Requests are sent from background threads; close() (or leaving the with
+    block) flushes and waits for them.
+    
+    Example:
+        with BatchingSlackMCPClient(client) as batcher:
+            futures = [batcher.call_tool("slack_get_user_profile", {"user_id": u}) for u in user_ids]
+            profiles = [future.result() for future in futures]
+    """
+    
+    def __init__(
+        self,
+        client: SlackMCPClient,
+        buffer_ms: float = 50,
+        buffer_max: int = 20,
+        should_batch: Optional[Callable[[str], bool]] = None
+    ):
+        self.client = client
+        self.buffer_ms = buffer_ms
+        self.buffer_max = buffer_max
+        self.should_batch = should_batch or (lambda tool_name: True)
+        self._queue: List[Tuple[Future, str, Dict[str, Any]]] = []
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        # Sends full batches and unbatched calls so call_tool() never blocks on the network
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mcp-batch")
+    
+    def close(self) -> None:
+        """Send all queued calls and wait for every in-flight request"""
+        self.flush()
+        self._executor.shutdown(wait=True)
+    
+    def __enter__(self) -> "BatchingSlackMCPClient":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Future:
+        """Queue a tool call; the returned future resolves when its batch is sent"""
+        if not self.should_batch(tool_name):
+            return self._executor.submit(self.client.call_tool, tool_name, arguments)
+        
+        future: Future = Future()
+        with self._lock:
+            self._queue.append((future, tool_name, arguments))
+            if len(self._queue) >= self.buffer_max:
+                queue = self._take_queue()
+            else:
+                queue = None
+                if self._timer is None:
+                    self._timer = threading.Timer(self.buffer_ms / 1000, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+        
+        if queue:
+            self._executor.submit(self._send, queue)
+        return future
+    
+    def flush(self) -> None:
+        """Send all queued calls now"""
+        with self._lock:
+            queue = self._take_queue()
+        if queue:
+            self._send(queue)
+    
+    def _take_queue(self) -> List[Tuple[Future, str, Dict[str, Any]]]:
+        """Detach the pending queue and stop its timer (caller holds the lock)"""
+        queue, self._queue = self._queue, []
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return queue
+    
+    def _send(self, queue: List[Tuple[Future, str, Dict[str, Any]]]) -> None:
+        # Drop calls the caller already cancelled, as concurrent.futures executors do
+        queue = [entry for entry in queue if entry[0].set_running_or_notify_cancel()]
+        if not queue:
+            return
+        
+        try:
+            results = self.client.batch([(tool_name, arguments) for _, tool_name, arguments in queue])
+        except Exception as e:
+            for future, _, _ in queue:
+                future.set_exception(e)
+            return
+        
+        for (future, _, _), result in zip(queue, results):
+            future.set_result(result)
+
+
+class AsyncSlackMCPClient(_BaseSlackMCPClient):
+    """
+    Async client that multiplexes concurrent calls over one HTTP/2 connection.
+    Requires httpx with HTTP/2 support: pip install 'httpx[http2]'
+    
+    Example:
+        async with AsyncSlackMCPClient() as client:
+            channels, users = await asyncio.gather(client.list_channels(), client.get_users())
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if httpx is None:
+            raise ImportError("AsyncSlackMCPClient requires httpx: pip install 'httpx[http2]'")
+        
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=8,
+                max_connections=16,
+                # Below the server's keep-alive timeout, so idle sockets are closed by us first
+                keepalive_expiry=30
+            ),
+            uds=self.unix_socket
+        )
+        self._client = httpx.AsyncClient(transport=transport, headers=self._base_headers)
+        
+        # Pending read-only tool calls, keyed by (tool_name, arguments)
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+    
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client"""
+        await self._client.aclose()
+    
+    async def __aenter__(self) -> "AsyncSlackMCPClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    async def _post_raw(self, payload: Any, slack: bool = False) -> bytes:
+        """POST a JSON-RPC payload, batch or pre-serialized body to /mcp and return the raw body"""
+        body = payload if isinstance(payload, bytes) else _json_dumps(payload)
+        for attempt in range(RETRY_TOTAL + 1):
+            # Streamed so an oversized body can be refused from its Content-Length alone
+            async with self._client.stream(
+                "POST",
+                self._mcp_url,
+                headers=self._slack_headers if slack else None,
+                content=body
+            ) as response:
+                # Refused requests (e.g. rate limited) are retried like SlackMCPClient does
+                delay = None
+                if response.status_code in RETRY_REFUSED_STATUSES and attempt < RETRY_TOTAL:
+                    delay = _retry_delay(attempt, response.headers.get("Retry-After"))
+                if delay is None:
+                    if response.status_code >= 400:
+                        raise httpx.HTTPStatusError(
+                            f"{response.status_code} Error for url: {response.url}",
+                            request=response.request,
+                            response=response
+                        )
+                    self._check_response_size(response.headers.get("Content-Length"))
+                    content = await response.aread()
+                    break
+            await asyncio.sleep(delay)
+        self._check_response_size(len(content))
+        return content
+    
+    async def _post(self, payload: Any, slack: bool = False) -> Any:
+        """POST a JSON-RPC payload (or batch) to the MCP endpoint"""
+        return _json_loads(await self._post_raw(payload, slack))
+    
+    async def _get(self, path: str) -> Dict[str, Any]:
+        """GET a JSON document from the server"""
+        response = await self._client.get(f"{self.server_url}{path}")
+        if response.status_code >= 400:
+            raise httpx.HTTPStatusError(
+                f"{response.status_code} Error for url: {response.url}",
+                request=response.request,
+                response=response
+            )
+        return _json_loads(response.content)
+    
+    async def health_check(self) -> Dict[str, Any]:
+        """Check server health"""
+        return await self._get("/health")
+    
+    async def is_healthy(self) -> bool:
+        """Cheap health probe that skips JSON decoding"""
+        response = await self._client.get(f"{self.server_url}/health")
+        return response.status_code == 200 and b'"healthy"' in response.content
+    
+    async def get_server_info(self) -> Dict[str, Any]:
+        """Get server information"""
+        return await self._get("/")
+    
+    async def initialize(self) -> Dict[str, Any]:
+        """Initialize MCP connection"""
+        result = await self._post(self._initialize_payload())
+        self._record_capabilities(result)
+        return result
+    
+    async def list_tools(self, refresh: bool = False) -> Dict[str, Any]:
+        """List available tools (cached after the first successful call)"""
+        if self._tools_cache is None or refresh:
+            result = await self._post(self._list_tools_payload())
+            if "error" in result:
+                return result
+            self._tools_cache = result
+        # A copy, so callers cannot alter what later calls see
+        return copy.deepcopy(self._tools_cache)
+    
+    async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Call a tool"""
+        key = self._dedupe_key(tool_name, arguments) if tool_name in READ_ONLY_TOOLS else None
+        if key is None:
+            return await self._post(self._call_tool_payload(tool_name, arguments), slack=True)
+        
+        # Concurrent identical read-only calls await the same request
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._post(self._call_tool_payload(tool_name, arguments), slack=True)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one cancelled caller does not cancel the shared request;
+        # each caller gets its own copy of the shared response
+        return copy.deepcopy(await asyncio.shield(task))
+    
+    async def call_tool_raw(self, tool_name: str, arguments: Dict[str, Any]) -> bytes:
+        """Call a tool and return the undecoded JSON-RPC response body"""
+        return await self._post_raw(self._call_tool_payload(tool_name, arguments), slack=True)
+    
+    async def get_user_profile(self, user_id: str) -> Dict[str, Any]:
+        """Get user profile (cached for PROFILE_CACHE_TTL seconds)"""
+        cached = self._get_cached_profile(user_id)
+        if cached is not None:
+            return cached
+        result = await self.call_tool("slack_get_user_profile", {"user_id": user_id})
+        self._cache_profile(user_id, result)
+        return result
+    
+    async def iter_channels(self, page_size: int = 200) -> AsyncIterator[Dict[str, Any]]:
+        """Yield every channel, following pagination cursors"""
+        cursor = None
+        while True:
+            page = self._parse_page(await self.list_channels(limit=page_size, cursor=cursor), "slack_list_channels")
+            for channel in page.get("channels", []):
+                yield channel
+            cursor = page.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                break
+    
+    async def iter_users(self, page_size: int = 200) -> AsyncIterator[Dict[str, Any]]:
+        """Yield every workspace user, following pagination cursors"""
+        cursor = None
+        while True:
+            page = self._parse_page(await self.get_users(limit=page_size, cursor=cursor), "slack_get_users")
+            for user in page.get("members", []):
+                yield user
+            cursor = page.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                break
+    
+    async def gather_tools(self, *calls: Tuple[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run independent tool calls concurrently over the shared connection pool"""
+        return list(await asyncio.gather(*[
+            self.call_tool(tool_name, arguments) for tool_name, arguments in calls
+        ]))
+    
+    async def batch(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Call several tools in JSON-RPC batch requests (see SlackMCPClient.batch)"""
+        if not self.supports_batching:
+            return await self.gather_tools(*calls)
+        
+        results = []
+        for payload in self._batch_payloads(calls):
+            results.extend(self._match_batch_responses(payload, await self._post(payload, slack=True)))
+        return results
+
+
+_default_client: Optional[SlackMCPClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> SlackMCPClient:
+    """
+    Get the shared SlackMCPClient (credentials from environment variables),
+    creating it on first use. Reuse it instead of constructing a client per
+    request, e.g. in web handlers, so every caller shares one connection pool.
+    It can be used from several threads; the urllib3 pool behind its
+    requests.Session is thread-safe.
+    """
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = SlackMCPClient()
+    return _default_client
+
+
+def _result(value: Any) -> Any:
+    """Re-raise an exception captured by fetch_discovery*()"""
+    if isinstance(value, BaseException):
+        raise value
+    return value
+
+
+def fetch_discovery(client: SlackMCPClient) -> List[Any]:
+    """Run the discovery calls one after another, capturing errors"""
+    results: List[Any] = []
+    for call in (client.health_check, client.get_server_info, client.initialize, client.list_tools):
+        try:
+            results.append(call())
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+async def fetch_discovery_async() -> List[Any]:
+    """Run the independent discovery calls concurrently, capturing errors"""
+    async with AsyncSlackMCPClient() as client:
+        return list(await asyncio.gather(
+            client.health_check(),
+            client.get_server_info(),
+            client.initialize(),
+            client.list_tools(),
+            return_exceptions=True
+        ))
+
+
+def run_examples(client: SlackMCPClient, discovery: List[Any]):
+    """Run the example calls against the server"""
+    health, info, init_result, tools_result = discovery
     
     # Test 1: Health check
     print("1. Health Check")
     try:
-        health = client.health_check()
+        health = _result(health)
         print(f"   Status: {health['status']}")
         print()
     except Exception as e:
@@ -202,7 +1095,7 @@ def main():
     # Test 2: Server info
     print("2. Server Information")
     try:
-        info = client.get_server_info()
+        info = _result(info)
         print(f"   Service: {info['service']}")
         print(f"   Version: {info['version']}")
         print()
@@ -212,7 +1105,7 @@ def main():
     # Test 3: Initialize
     print("3. Initialize MCP Connection")
     try:
-        init_result = client.initialize()
+        init_result = _result(init_result)
         print(f"   Protocol: {init_result['result']['protocolVersion']}")
         print(f"   Server: {init_result['result']['serverInfo']['name']}")
         print()
@@ -222,7 +1115,7 @@ def main():
     # Test 4: List tools
     print("4. List Available Tools")
     try:
-        tools_result = client.list_tools()
+        tools_result = _result(tools_result)
         tools = tools_result['result']['tools']
         print(f"   Found {len(tools)} tools:")
         for tool in tools:
@@ -236,7 +1129,7 @@ def main():
         print("5. List Slack Channels")
         try:
             channels_result = client.list_channels(limit=5)
-            result_content = json.loads(channels_result['result']['content'][0]['text'])
+            result_content = client.decode_tool_result(channels_result)
             if result_content.get('ok'):
                 channels = result_content.get('channels', [])
                 print(f"   Found {len(channels)} channels:")
@@ -258,7 +1151,7 @@ def main():
                     channel_id,
                     f"Test message from Python MCP client at {datetime.now().isoformat()}"
                 )
-                result_content = json.loads(message_result['result']['content'][0]['text'])
+                result_content = client.decode_tool_result(message_result)
                 if result_content.get('ok'):
                     print(f"   Message posted successfully!")
                     print(f"   Timestamp: {result_content.get('ts')}")
@@ -275,6 +1168,22 @@ def main():
         print("5-6. Slack Operations")
         print("   Skipped: Set SLACK_BOT_TOKEN and SLACK_TEAM_ID environment variables to test")
         print()
+
+
+def main():
+    """Example usage"""
+    print("Slack MCP Client Example\n")
+    
+    # Discovery calls are independent, so run them concurrently when httpx is available
+    try:
+        discovery = asyncio.run(fetch_discovery_async())
+    except ImportError:
+        discovery = None
+    
+    client = get_default_client()
+    if discovery is None:
+        discovery = fetch_discovery(client)
+    run_examples(client, discovery)
     
     print("Example completed!")
 
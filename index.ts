@@ -5,8 +5,12 @@
  */
 
 import express, { Request, Response, NextFunction } from "express";
+import { IncomingHttpHeaders } from 'node:http';
 import { fileURLToPath } from 'node:url';
 import { resolve } from 'node:path';
+import { lstatSync, rmSync } from 'node:fs';
+import { createConnection } from 'node:net';
+import { brotliCompressSync, constants as zlibConstants, gzipSync } from 'node:zlib';
 
 // Type definitions for tool arguments
 interface ListChannelsArgs {
@@ -55,6 +59,18 @@ const SECRET_KEY = process.env.SECRET_KEY || "";
 const PORT = parseInt(process.env.PORT || "8080", 10);
 const HOST = process.env.HOST || "0.0.0.0";
 const REQUIRE_AUTH = (process.env.REQUIRE_AUTH || "true").toLowerCase() === "true";
+// When set, listen on this UNIX domain socket instead of HOST:PORT
+const SOCKET_PATH = process.env.SOCKET_PATH || "";
+// Idle keep-alive connections are closed after this many milliseconds. Node's
+// default of 5s is shorter than typical client pool expiry (30s), which makes
+// clients reconnect (and redo the TLS handshake) far more often than needed.
+const KEEP_ALIVE_TIMEOUT_MS = parseInt(process.env.KEEP_ALIVE_TIMEOUT_MS || "35000", 10);
+
+// Largest JSON-RPC batch accepted in one POST; each element may make a Slack API call
+const MAX_BATCH_SIZE = parseInt(process.env.MAX_BATCH_SIZE || "50", 10);
+
+// JSON responses smaller than this are sent uncompressed
+const COMPRESSION_THRESHOLD = 1024;
 
 export class SlackClient {
   private botHeaders: { Authorization: string; "Content-Type": string };
@@ -451,6 +467,151 @@ async function handleToolCall(toolName: string, args: any, slackClient: SlackCli
   }
 }
 
+// Handle a single JSON-RPC message sent to the /mcp endpoint
+export async function handleMcpMessage(body: any, headers: IncomingHttpHeaders): Promise<any> {
+  try {
+    const method = body?.method;
+    const params = body?.params || {};
+    const requestId = body?.id;
+
+    // Extract Slack credentials from headers
+    const slackBotToken = headers["x-slack-bot-token"] as string | undefined;
+    const slackTeamId = headers["x-slack-team-id"] as string | undefined;
+    const slackChannelIds = headers["x-slack-channel-ids"] as string | undefined;
+
+    // Route to appropriate handler based on method
+    if (method === "initialize") {
+      const result = {
+        protocolVersion: "2024-11-05",
+        capabilities: {
+          tools: {},
+          prompts: null,
+          resources: null,
+          experimental: {
+            // Clients may POST a JSON-RPC array of up to maxBatchSize requests to /mcp
+            batching: { maxBatchSize: MAX_BATCH_SIZE }
+          }
+        },
+        serverInfo: {
+          name: "slack-mcp-server",
+          version: "1.0.0"
+        }
+      };
+
+      return {
+        jsonrpc: "2.0",
+        result,
+        id: requestId
+      };
+    } else if (method === "tools/list") {
+      const result = {
+        tools: getToolsList()
+      };
+
+      return {
+        jsonrpc: "2.0",
+        result,
+        id: requestId
+      };
+    } else if (method === "tools/call") {
+      // Validate Slack credentials for tool execution
+      if (!slackBotToken || !slackTeamId) {
+        return {
+          jsonrpc: "2.0",
+          error: {
+            code: -32602,
+            message: "Missing required Slack credentials in headers: x-slack-bot-token and x-slack-team-id are required"
+          },
+          id: requestId
+        };
+      }
+
+      // Create Slack client with credentials from headers
+      const slackClient = new SlackClient(slackBotToken, slackTeamId, slackChannelIds);
+
+      const toolName = params.name;
+      const toolArguments = params.arguments || {};
+
+      const result = await handleToolCall(toolName, toolArguments, slackClient);
+
+      return {
+        jsonrpc: "2.0",
+        result,
+        id: requestId
+      };
+    } else {
+      // Method not found
+      return {
+        jsonrpc: "2.0",
+        error: {
+          code: -32601,
+          message: `Method not found: ${method}`
+        },
+        id: requestId
+      };
+    }
+  } catch (error: any) {
+    console.error("Error handling MCP request:", error);
+    return {
+      jsonrpc: "2.0",
+      error: {
+        code: -32603,
+        message: `Internal error: ${error.message || String(error)}`
+      },
+      id: body?.id || null
+    };
+  }
+}
+
+// Pick br or gzip if the Accept-Encoding header allows it; q=0 refuses an encoding
+function pickEncoding(acceptEncoding: string): "br" | "gzip" | null {
+  const qualities = new Map<string, number>();
+  for (const part of acceptEncoding.split(",")) {
+    const [name, ...params] = part.trim().toLowerCase().split(";").map((item) => item.trim());
+    if (!name) {
+      continue;
+    }
+    const q = params.find((param) => param.startsWith("q="));
+    qualities.set(name, q ? parseFloat(q.slice(2)) || 0 : 1);
+  }
+
+  for (const encoding of ["br", "gzip"] as const) {
+    const quality = qualities.get(encoding) ?? qualities.get("*") ?? 0;
+    if (quality > 0) {
+      return encoding;
+    }
+  }
+  return null;
+}
+
+// Compress JSON responses for clients that send Accept-Encoding: br or gzip
+export function compressionMiddleware(req: Request, res: Response, next: NextFunction) {
+  const encoding = pickEncoding(String(req.headers["accept-encoding"] || ""));
+
+  if (!encoding) {
+    return next();
+  }
+
+  const sendJson = res.json.bind(res);
+  res.json = (body: any) => {
+    const payload = Buffer.from(JSON.stringify(body));
+    if (payload.length < COMPRESSION_THRESHOLD) {
+      return sendJson(body);
+    }
+
+    const compressed = encoding === "br"
+      ? brotliCompressSync(payload, { params: { [zlibConstants.BROTLI_PARAM_QUALITY]: 4 } })
+      : gzipSync(payload);
+
+    res.setHeader("Content-Type", "application/json; charset=utf-8");
+    res.setHeader("Content-Encoding", encoding);
+    res.setHeader("Vary", "Accept-Encoding");
+    return res.send(compressed);
+  };
+
+  next();
+}
+
 // Authentication middleware
 function authMiddleware(req: Request, res: Response, next: NextFunction) {
   // Skip auth if not required
@@ -467,10 +628,14 @@ function authMiddleware(req: Request, res: Response, next: NextFunction) {
   // Only check auth for /mcp endpoint with POST method
   if (req.path === "/mcp" && req.method === "POST") {
     try {
-      const method = req.body?.method;
+      // A JSON-RPC batch is an array of requests; authenticate it as a whole
+      const isBatch = Array.isArray(req.body);
+      const messages: any[] = isBatch ? req.body : [req.body];
+      const methods = messages.map((message: any) => message?.method);
+      const responseId = isBatch ? null : req.body?.id || null;
 
       // Only require auth for tools/call
-      if (method === "tools/call") {
+      if (methods.includes("tools/call")) {
         const providedKey = req.headers["x-secret-key"] as string | undefined;
 
         if (!providedKey) {
@@ -482,7 +647,7 @@ function authMiddleware(req: Request, res: Response, next: NextFunction) {
               code: -32001,
               message: "Authentication required for tool execution"
             },
-            id: req.body?.id || null
+            id: responseId
           });
         }
 
@@ -495,13 +660,13 @@ function authMiddleware(req: Request, res: Response, next: NextFunction) {
               code: -32001,
               message: "Invalid authentication for tool execution"
             },
-            id: req.body?.id || null
+            id: responseId
           });
         }
       }
       // For discovery methods (initialize, tools/list), allow without auth
-      else if (method === "initialize" || method === "tools/list") {
-        console.log(`Allowing unauthenticated ${method} request`);
+      else if (methods.every((method: any) => method === "initialize" || method === "tools/list")) {
+        console.log(`Allowing unauthenticated ${methods.join(", ")} request`);
       }
     } catch (error) {
       console.error("Error in auth middleware:", error);
@@ -512,10 +677,38 @@ function authMiddleware(req: Request, res: Response, next: NextFunction) {
   next();
 }
 
+// Remove a socket file left behind by a previous run. Refuses to touch anything
+// that is not a socket, or a socket a running server still accepts connections on.
+async function removeStaleSocket(socketPath: string): Promise<void> {
+  let isSocket: boolean;
+  try {
+    isSocket = lstatSync(socketPath).isSocket();
+  } catch {
+    return; // Nothing there yet
+  }
+  if (!isSocket) {
+    throw new Error(`SOCKET_PATH ${socketPath} exists and is not a socket`);
+  }
+
+  const inUse = await new Promise<boolean>((resolve) => {
+    const probe = createConnection(socketPath);
+    probe.once('connect', () => {
+      probe.end();
+      resolve(true);
+    });
+    probe.once('error', () => resolve(false));
+  });
+  if (inUse) {
+    throw new Error(`Another server is already listening on ${socketPath}`);
+  }
+  rmSync(socketPath, { force: true });
+}
+
 // Main HTTP server
-function createHttpServer() {
+export function createHttpServer() {
   const app = express();
   app.use(express.json());
+  app.use(compressionMiddleware);
   app.use(authMiddleware);
 
   // Health check endpoint
@@ -549,114 +742,71 @@ function createHttpServer() {
 
   // Main MCP endpoint
   app.post("/mcp", async (req: Request, res: Response) => {
-    try {
-      const body = req.body;
-      console.log("Received MCP request:", JSON.stringify(body, null, 2));
-
-      const method = body.method;
-      const params = body.params || {};
-      const requestId = body.id;
-
-      // Extract Slack credentials from headers
-      const slackBotToken = req.headers["x-slack-bot-token"] as string | undefined;
-      const slackTeamId = req.headers["x-slack-team-id"] as string | undefined;
-      const slackChannelIds = req.headers["x-slack-channel-ids"] as string | undefined;
-
-      // Route to appropriate handler based on method
-      if (method === "initialize") {
-        const result = {
-          protocolVersion: "2024-11-05",
-          capabilities: {
-            tools: {},
-            prompts: null,
-            resources: null
-          },
-          serverInfo: {
-            name: "slack-mcp-server",
-            version: "1.0.0"
-          }
-        };
+    const body = req.body;
+    console.log("Received MCP request:", JSON.stringify(body, null, 2));
 
+    // JSON-RPC 2.0 batch: handle every request and reply with an array of responses
+    if (Array.isArray(body)) {
+      if (body.length === 0) {
         return res.json({
           jsonrpc: "2.0",
-          result,
-          id: requestId
-        });
-      } else if (method === "tools/list") {
-        const result = {
-          tools: getToolsList()
-        };
-
-        return res.json({
-          jsonrpc: "2.0",
-          result,
-          id: requestId
+          error: {
+            code: -32600,
+            message: "Invalid Request: empty batch"
+          },
+          id: null
         });
-      } else if (method === "tools/call") {
-        // Validate Slack credentials for tool execution
-        if (!slackBotToken || !slackTeamId) {
-          return res.json({
-            jsonrpc: "2.0",
-            error: {
-              code: -32602,
-              message: "Missing required Slack credentials in headers: x-slack-bot-token and x-slack-team-id are required"
-            },
-            id: requestId
-          });
-        }
-
-        // Create Slack client with credentials from headers
-        const slackClient = new SlackClient(slackBotToken, slackTeamId, slackChannelIds);
-
-        const toolName = params.name;
-        const toolArguments = params.arguments || {};
-
-        const result = await handleToolCall(toolName, toolArguments, slackClient);
+      }
 
-        return res.json({
-          jsonrpc: "2.0",
-          result,
-          id: requestId
-        });
-      } else {
-        // Method not found
+      if (body.length > MAX_BATCH_SIZE) {
         return res.json({
           jsonrpc: "2.0",
           error: {
-            code: -32601,
-            message: `Method not found: ${method}`
+            code: -32600,
+            message: `Invalid Request: batch exceeds ${MAX_BATCH_SIZE} requests`
           },
-          id: requestId
+          id: null
         });
       }
-    } catch (error: any) {
-      console.error("Error handling MCP request:", error);
-      return res.json({
-        jsonrpc: "2.0",
-        error: {
-          code: -32603,
-          message: `Internal error: ${error.message || String(error)}`
-        },
-        id: req.body?.id || null
-      });
+
+      const responses = await Promise.all(
+        body.map((message: any) => handleMcpMessage(message, req.headers))
+      );
+      return res.json(responses);
     }
+
+    return res.json(await handleMcpMessage(body, req.headers));
   });
 
   return app;
 }
 
 export async function main() {
-  console.log(`Starting MCP Slack Server on ${HOST}:${PORT}`);
+  const address = SOCKET_PATH ? `unix:${SOCKET_PATH}` : `${HOST}:${PORT}`;
+  console.log(`Starting MCP Slack Server on ${address}`);
   console.log(`Authentication enabled: ${REQUIRE_AUTH}`);
   console.log(`Secret Key configured: ${SECRET_KEY ? 'Yes' : 'No'}`);
 
   const app = createHttpServer();
-  
-  const httpServer = app.listen(PORT, HOST, () => {
-    console.log(`MCP Slack Server running on http://${HOST}:${PORT}`);
-    console.log(`Health check available at http://${HOST}:${PORT}/health`);
-    console.log(`MCP endpoint at http://${HOST}:${PORT}/mcp`);
-  });
+
+  const onListening = () => {
+    // Over a socket, clients address the server as http://localhost (e.g. curl --unix-socket)
+    const baseUrl = SOCKET_PATH ? "http://localhost" : `http://${HOST}:${PORT}`;
+    console.log(`MCP Slack Server running on ${SOCKET_PATH ? address : baseUrl}`);
+    console.log(`Health check available at ${baseUrl}/health`);
+    console.log(`MCP endpoint at ${baseUrl}/mcp`);
+  };
+
+  if (SOCKET_PATH) {
+    await removeStaleSocket(SOCKET_PATH);
+  }
+
+  const httpServer = SOCKET_PATH
+    ? app.listen(SOCKET_PATH, onListening)
+    : app.listen(PORT, HOST, onListening);
+  httpServer.keepAliveTimeout = KEEP_ALIVE_TIMEOUT_MS;
+  // Must exceed keepAliveTimeout, or Node may drop a reused socket mid-request
+  httpServer.headersTimeout = KEEP_ALIVE_TIMEOUT_MS + 1000;
 
   // Setup graceful shutdown handlers
   const shutdown = (signal: string) => {
@@ -666,6 +816,9 @@ export async function main() {
       console.log('HTTP server closed.');
       process.exit(0);
     });
+    // Pooled clients hold idle keep-alive sockets for up to KEEP_ALIVE_TIMEOUT_MS;
+    // Node 18's close() waits for them, so drop them now
+    httpServer.closeIdleConnections();
     
     // Force close after 5 seconds
     setTimeout(() => {
@@ -0,0 +1,115 @@
+import { describe, expect, test, jest, beforeEach, afterEach } from '@jest/globals';
+import { request as httpRequest, Server } from 'node:http';
+import { AddressInfo } from 'node:net';
+
+// Route-level tests run the real express app, so unlike
+// slack-mcp-server.test.ts this file does not mock express
+
+const originalEnv = process.env;
+
+beforeEach(() => {
+  jest.resetModules();
+  process.env = { ...originalEnv };
+});
+
+afterEach(() => {
+  process.env = originalEnv;
+});
+
+describe('MCP endpoint', () => {
+  let server: Server | undefined;
+
+  // Start the app on an ephemeral port
+  const startServer = async () => {
+    const { createHttpServer } = await import('../index.js');
+    server = createHttpServer().listen(0, '127.0.0.1');
+    await new Promise((resolve) => server!.once('listening', resolve));
+    return (server!.address() as AddressInfo).port;
+  };
+
+  const postMcp = (port: number, body: unknown, headers: Record<string, string> = {}) =>
+    new Promise<{ status: number; body: any }>((resolve, reject) => {
+      const req = httpRequest(
+        {
+          host: '127.0.0.1',
+          port,
+          path: '/mcp',
+          method: 'POST',
+          headers: { 'Content-Type': 'application/json', ...headers },
+        },
+        (res) => {
+          let data = '';
+          res.setEncoding('utf8');
+          res.on('data', (chunk) => { data += chunk; });
+          res.on('end', () => resolve({ status: res.statusCode ?? 0, body: JSON.parse(data) }));
+        }
+      );
+      req.on('error', reject);
+      req.end(JSON.stringify(body));
+    });
+
+  afterEach(async () => {
+    if (server) {
+      await new Promise((resolve) => server!.close(resolve));
+      server = undefined;
+    }
+  });
+
+  test('batch returns an array of responses', async () => {
+    const port = await startServer();
+
+    const response = await postMcp(port, [
+      { jsonrpc: '2.0', method: 'initialize', params: {}, id: 1 },
+      { jsonrpc: '2.0', method: 'tools/list', params: {}, id: 2 },
+    ]);
+
+    expect(response.status).toBe(200);
+    expect(Array.isArray(response.body)).toBe(true);
+    expect(response.body.map((item: any) => item.id)).toEqual([1, 2]);
+    expect(response.body[1].result.tools.length).toBeGreaterThan(0);
+  });
+
+  test('empty batch returns invalid request', async () => {
+    const port = await startServer();
+
+    const response = await postMcp(port, []);
+
+    expect(response.body.error.code).toBe(-32600);
+    expect(response.body.id).toBeNull();
+  });
+
+  test('batch over MAX_BATCH_SIZE returns invalid request', async () => {
+    process.env.MAX_BATCH_SIZE = '2';
+    const port = await startServer();
+
+    const response = await postMcp(port, [1, 2, 3].map((id) => (
+      { jsonrpc: '2.0', method: 'tools/list', params: {}, id }
+    )));
+
+    expect(response.body.error.code).toBe(-32600);
+    expect(response.body.error.message).toContain('2');
+  });
+
+  test('batch containing tools/call requires x-secret-key', async () => {
+    process.env.SECRET_KEY = 'test-secret';
+    process.env.REQUIRE_AUTH = 'true';
+    const port = await startServer();
+    const batch = [
+      { jsonrpc: '2.0', method: 'initialize', params: {}, id: 1 },
+      { jsonrpc: '2.0', method: 'tools/call', params: { name: 'slack_get_users', arguments: {} }, id: 2 },
+    ];
+
+    const missing = await postMcp(port, batch);
+    expect(missing.status).toBe(401);
+    expect(missing.body.error.code).toBe(-32001);
+    expect(missing.body.id).toBeNull();
+
+    const invalid = await postMcp(port, batch, { 'x-secret-key': 'wrong' });
+    expect(invalid.status).toBe(401);
+
+    // Discovery-only batches need no key
+    const discovery = await postMcp(port, [batch[0]]);
+    expect(discovery.status).toBe(200);
+    expect(discovery.body[0].id).toBe(1);
+  });
+});
@@ -1,4 +1,5 @@
 import { describe, expect, test, jest, beforeEach, afterEach } from '@jest/globals';
+import { gunzipSync } from 'node:zlib';
 
 // Mock fetch globally
 (global as any).fetch = jest.fn();
@@ -399,4 +400,97 @@ describe('HTTP Server', () => {
     expect(indexModule.SlackClient).toBeDefined();
     expect(indexModule.main).toBeDefined();
   });
-});
\ No newline at end of file
+});
+
+describe('MCP JSON-RPC handling', () => {
+  test('initialize advertises batching support', async () => {
+    const { handleMcpMessage } = await import('../index.js');
+
+    const response = await handleMcpMessage(
+      { jsonrpc: '2.0', method: 'initialize', params: {}, id: 1 },
+      {}
+    );
+
+    expect(response.id).toBe(1);
+    expect(response.result.capabilities.experimental).toEqual({ batching: { maxBatchSize: 50 } });
+  });
+
+  test('tools/call without Slack credentials returns an error', async () => {
+    const { handleMcpMessage } = await import('../index.js');
+
+    const response = await handleMcpMessage(
+      { jsonrpc: '2.0', method: 'tools/call', params: { name: 'slack_get_users', arguments: {} }, id: 2 },
+      {}
+    );
+
+    expect(response.id).toBe(2);
+    expect(response.error.code).toBe(-32602);
+  });
+
+  test('unknown method returns method not found', async () => {
+    const { handleMcpMessage } = await import('../index.js');
+
+    const response = await handleMcpMessage(
+      { jsonrpc: '2.0', method: 'unknown/method', id: 3 },
+      {}
+    );
+
+    expect(response.error.code).toBe(-32601);
+  });
+});
+
+describe('Response compression', () => {
+  const createResponse = () => {
+    const res: any = {
+      json: jest.fn(),
+      send: jest.fn(),
+      setHeader: jest.fn(),
+    };
+    return res;
+  };
+
+  test('gzips large JSON responses when the client accepts gzip', async () => {
+    const { compressionMiddleware } = await import('../index.js');
+    const req: any = { headers: { 'accept-encoding': 'gzip, deflate' } };
+    const res = createResponse();
+    const next = jest.fn();
+    const body = { text: 'x'.repeat(4096) };
+
+    compressionMiddleware(req, res, next);
+    res.json(body);
+
+    expect(next).toHaveBeenCalled();
+    expect(res.setHeader).toHaveBeenCalledWith('Content-Encoding', 'gzip');
+    const sent = res.send.mock.calls[0][0] as Buffer;
+    expect(JSON.parse(gunzipSync(sent).toString())).toEqual(body);
+  });
+
+  test('leaves small responses and non-accepting clients untouched', async () => {
+    const { compressionMiddleware } = await import('../index.js');
+    const res = createResponse();
+    const originalJson = res.json;
+
+    compressionMiddleware({ headers: {} } as any, res, jest.fn());
+    expect(res.json).toBe(originalJson);
+
+    compressionMiddleware({ headers: { 'accept-encoding': 'gzip' } } as any, res, jest.fn());
+    res.json({ status: 'healthy' });
+    expect(originalJson).toHaveBeenCalledWith({ status: 'healthy' });
+    expect(res.send).not.toHaveBeenCalled();
+  });
+
+  test('honors q=0 in Accept-Encoding', async () => {
+    const { compressionMiddleware } = await import('../index.js');
+    const body = { text: 'x'.repeat(4096) };
+
+    const refused = createResponse();
+    const originalJson = refused.json;
+    compressionMiddleware({ headers: { 'accept-encoding': 'br;q=0, gzip;q=0' } } as any, refused, jest.fn());
+    expect(refused.json).toBe(originalJson);
+
+    const fallback = createResponse();
+    compressionMiddleware({ headers: { 'accept-encoding': 'br;q=0, gzip' } } as any, fallback, jest.fn());
+    fallback.json(body);
+    expect(fallback.setHeader).toHaveBeenCalledWith('Content-Encoding', 'gzip');
+  });
+});